@@ -35,22 +35,32 @@ dist_data = [
     19, 11, 6, 17, 5, 0, 1, 17, 17
 ]
 
+DEBUG = os.getenv('DEBUG') == '1'
+
+
+def debug(msg):
+    if DEBUG:
+        print(msg)
+
+
 for i in range(50):
-    print("rate")
+    debug("rate")
     statsd.increment('foo_metric.rate', tags=['a_tag:1'])
 
-    print("gauge")
+    debug("gauge")
     statsd.gauge('foo_metric.gauge', i, tags=["a_tag:2"])
 
-    print("set")
+    debug("set")
     statsd.set('foo_metric.set', i, tags=["a_tag:3"])
 
-    print("histogram")
+    debug("histogram")
     statsd.histogram('foo_metric.histogram', hist_data[i], tags=["a_tag:4"])
 
-    print("distribution")
+    debug("distribution")
     statsd.distribution('foo_metric.distribution', dist_data[i], tags=["a_tag:5"])
 
-    statsd.flush()
     time.sleep(0.01)
 
+# The default client sends each metric as it is recorded; this is only a
+# safeguard in case anything is still buffered.
+statsd.flush()